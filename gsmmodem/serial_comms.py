@@ -16,7 +16,7 @@ class SerialComms(object):
     log = logging.getLogger('gsmmodem.serial_comms.SerialComms')
     
     # End-of-line read terminator
-    RX_EOL_SEQ = '\r\n'
+    RX_EOL_SEQ = b'\r\n'
     # End-of-response terminator
     RESPONSE_TERM = re.compile(r'^OK|ERROR|(\+CM[ES] ERROR: \d+)|(COMMAND NOT SUPPORT)$')
     # Default timeout for serial port reads (in seconds)
@@ -45,6 +45,8 @@ class SerialComms(object):
     def connect(self):
         """ Connects to the device and starts the read thread """                
         self.serial = serial.Serial(port=self.port, baudrate=self.baudrate, timeout=self.timeout)
+        # Receive buffer; reused for the lifetime of the read thread (consumed lines are deleted from the front)
+        self._rxBuffer = bytearray()
         # Start read thread
         self.alive = True 
         self.rxThread = threading.Thread(target=self._readLoop)
@@ -62,7 +64,7 @@ class SerialComms(object):
         if self._responseEvent and not self._responseEvent.is_set():
             # A response event has been set up (another thread is waiting for this response)
             self._response.append(line)
-            if not checkForResponseTerm or self.RESPONSE_TERM.match(line):
+            if not checkForResponseTerm or self._isResponseTerm(line):
                 # End of response reached; notify waiting thread
                 #print 'response:', self._response
                 self.log.debug('response: %s', self._response)
@@ -70,13 +72,31 @@ class SerialComms(object):
         else:            
             # Nothing was waiting for this - treat it as a notification
             self._notification.append(line)
-            if self.serial.inWaiting() == 0:
+            if len(self._rxBuffer) == 0 and self.serial.inWaiting() == 0:
                 # No more chars on the way for this notification - notify higher-level callback
                 #print 'notification:', self._notification
                 self.log.debug('notification: %s', self._notification)
                 self.notifyCallback(self._notification)
                 self._notification = []                
 
+    def _isResponseTerm(self, line):
+        """ Checks if the specified line terminates a command response
+        
+        Dispatches on the line's first character so that the common OK/ERROR
+        cases are handled with plain string compares; the RESPONSE_TERM regex
+        is only evaluated for +CME/+CMS error lines.
+        """
+        c0 = line[:1]
+        if c0 == 'O':
+            return line.startswith('OK')
+        elif c0 == 'E':
+            return line.startswith('ERROR')
+        elif c0 == '+':
+            return self.RESPONSE_TERM.match(line) != None
+        elif c0 == 'C':
+            return line == 'COMMAND NOT SUPPORT'
+        return False
+
     def _placeholderCallback(self, *args, **kwargs):
         """ Placeholder callback function (does nothing) """
         
@@ -86,26 +106,37 @@ class SerialComms(object):
         Reads lines from the connected device
         """
         try:
-            readTermSeq = list(self.RX_EOL_SEQ)
+            readTermSeq = self.RX_EOL_SEQ
             readTermLen = len(readTermSeq)
-            rxBuffer = []
+            rxBuffer = self._rxBuffer
             while self.alive:
-                data = self.serial.read(1)
-                if data != '': # check for timeout
+                # Fetch everything the port has already buffered in one call; otherwise block for a single byte
+                data = self.serial.read(self.serial.inWaiting() or 1)
+                if data: # check for timeout
                     #print >> sys.stderr, ' RX:', data,'({0})'.format(ord(data))
-                    rxBuffer.append(data)
-                    if rxBuffer[-readTermLen:] == readTermSeq:                        
-                        # A line (or other logical segment) has been read
-                        line = ''.join(rxBuffer[:-readTermLen])
-                        rxBuffer = []
-                        if len(line) > 0:                          
-                            #print 'calling handler'                      
-                            self._handleLineRead(line)
-                    elif self._expectResponseTermSeq:
-                        if rxBuffer[-len(self._expectResponseTermSeq):] == self._expectResponseTermSeq:
-                            line = ''.join(rxBuffer) 
-                            rxBuffer = []
-                            self._handleLineRead(line, checkForResponseTerm=False)                                                
+                    rxBuffer.extend(data)
+                    while True:
+                        eolIdx = rxBuffer.find(readTermSeq)
+                        expectSeq = self._expectResponseTermSeq
+                        if expectSeq:
+                            # Only honour the expected terminator if it ends before the next EOL sequence does
+                            termIdx = rxBuffer.find(expectSeq, 0, len(rxBuffer) if eolIdx == -1 else eolIdx + readTermLen - 1)
+                        else:
+                            termIdx = -1
+                        if termIdx != -1:
+                            termEnd = termIdx + len(expectSeq)
+                            line = rxBuffer[:termEnd].decode('latin-1')
+                            del rxBuffer[:termEnd]
+                            self._handleLineRead(line, checkForResponseTerm=False)
+                        elif eolIdx != -1:
+                            # A line (or other logical segment) has been read; decode it in one go (latin-1 maps bytes 1:1)
+                            line = rxBuffer[:eolIdx].decode('latin-1')
+                            del rxBuffer[:eolIdx + readTermLen]
+                            if len(line) > 0:                          
+                                #print 'calling handler'                      
+                                self._handleLineRead(line)
+                        else:
+                            break
             #else:
                 #' <RX timeout>'
         except serial.SerialException as e:
@@ -121,7 +152,7 @@ class SerialComms(object):
         with self._txLock:            
             if waitForResponse:
                 if expectedResponseTermSeq:
-                    self._expectResponseTermSeq = list(expectedResponseTermSeq) 
+                    self._expectResponseTermSeq = expectedResponseTermSeq.encode('latin-1')
                 self._response = []
                 self._responseEvent = threading.Event()                
                 self.serial.write(data)
@@ -9,16 +9,30 @@ try:
 except ImportError:   
     from distutils.core import setup    
 
-with open('requirements.txt') as f:
-    requires = f.readlines() 
-if sys.version_info[0] == 2 and sys.version_info[1] <= 6:
+if sys.version_info < (2, 7):
     tests_require = ['unittest2']
+    # unittest2's test discovery is only available via its own runner scripts
     test_command = ['unit2', 'discover']
     coverage_command = ['coverage', 'run', '-m', 'unittest2', 'discover']
 else:
     tests_require = []
-    test_command = [sys.executable, '-m', 'unittest', 'discover']
-    coverage_command = ['coverage', 'run', '-m', 'unittest', 'discover']
+    # Tests are discovered and run in-process (see runUnitTests())
+    test_command = None
+    coverage_command = None
+
+def readRequirements():
+    """ Reads the package requirements from requirements.txt, skipping blank lines and comments """
+    with open('requirements.txt') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+def runUnitTests():
+    """ Discovers and runs all unit tests in the current process
+    
+    :return: True if all tests passed, False otherwise
+    """
+    import unittest
+    suite = unittest.TestLoader().discover('.')
+    return unittest.TextTestRunner().run(suite).wasSuccessful()
 
 VERSION = 0.9
 
@@ -26,7 +40,7 @@ class RunUnitTests(Command):
     """ run unit tests """
     
     user_options = []
-    description = __doc__[1:]
+    description = 'run unit tests'
 
     def initialize_options(self):
         pass
@@ -35,15 +49,18 @@ class RunUnitTests(Command):
         pass
         
     def run(self):
-        import subprocess
-        errno = subprocess.call(test_command)
+        if test_command != None:
+            import subprocess
+            errno = subprocess.call(test_command)
+        else:
+            errno = 0 if runUnitTests() else 1
         raise SystemExit(errno)
     
 class RunUnitTestsCoverage(Command):
     """ run unit tests and report on code coverage using the 'coverage' tool """
     
     user_options = []
-    description = __doc__[1:]
+    description = "run unit tests and report on code coverage using the 'coverage' tool"
 
     def initialize_options(self):
         pass
@@ -52,10 +69,23 @@ class RunUnitTestsCoverage(Command):
         pass
         
     def run(self):
-        import subprocess
-        errno = subprocess.call(coverage_command)
-        if errno == 0:
-            subprocess.call(['coverage', 'report'])
+        if coverage_command != None:
+            import subprocess
+            errno = subprocess.call(coverage_command)
+            if errno == 0:
+                subprocess.call(['coverage', 'report'])
+        else:
+            try:
+                import coverage
+            except ImportError:
+                raise SystemExit('The "coverage" package is not installed; install it (e.g. "pip install coverage") to run this command')
+            cov = coverage.Coverage()
+            cov.start()
+            errno = 0 if runUnitTests() else 1
+            cov.stop()
+            cov.save()
+            if errno == 0:
+                cov.report()
         raise SystemExit(errno)
 
 setup(name='python-gsmmodem',
@@ -113,7 +143,7 @@ Bundled utilities:
       packages=['gsmmodem', 'gsmtermlib'],
       package_dir = {'gsmtermlib': 'tools/gsmtermlib'},
       scripts=['tools/gsmterm.py', 'tools/sendsms.py', 'tools/identify-modem.py'],
-      install_requires=requires,
+      install_requires=readRequirements(),
       tests_require=tests_require,
       extras_require={'docs': ['sphinx']},
       cmdclass = {'test': RunUnitTests,
@@ -2,7 +2,10 @@
 Used to provide backwards-compatibility with Python 2.6
 """
 import sys
-if sys.version_info[0] == 2 and sys.version_info[1] < 7:
+
+_PY2 = sys.version_info[0] == 2
+
+if _PY2 and sys.version_info[1] < 7:
 
     import unittest
 
@@ -20,12 +23,8 @@ if sys.version_info[0] == 2 and sys.version_info[1] < 7:
     
     def assertListEqual(self, a, b, msg=None):
         """ Drop-in replacement for Python 2.7's method of the same name """
-        if len(a) != len(b):
-            raise self.failureException(msg or 'List length differs')
-        else:
-            for i in xrange(len(a)):
-                if a[i] != b[i]:
-                    raise self.failureException(msg or 'List differs: {0} != {1}'.format(a[i], b[i]))    
+        if a != b:
+            raise self.failureException(msg or 'List differs: {0} != {1}'.format(a, b))
     
     def assertIn(self, a, b, msg=None):
         """ Drop-in replacement for Python 2.7's method of the same name """
@@ -47,7 +46,7 @@ if sys.version_info[0] == 2 and sys.version_info[1] < 7:
     unittest.TestCase.assertIn = assertIn
     unittest.TestCase.assertNotIn = assertNotIn
     unittest.TestCase.assertIs = assertIs
-if sys.version_info[0] == 2:
+if _PY2:
     str = str
     bytearrayToStr = str
 else:
@@ -12,6 +12,11 @@ except ImportError:
     sys.path.insert(0, 'tools')
     import gsmtermlib.trie
 
+# Keys stored by TestTrie.test_filteredKeys(), and the (sorted) keys expected back for each prefix; built once, at import
+_FILTER_KEYS = ('a', 'ab', 'abc', 'abcd0000', 'abcd1111', 'abcd2222', 'abcd3333', 'b000', 'b1111', 'zzz123', 'zzzz1234', 'xyz123', 'AT+CSCS')
+_FILTER_PREFIX_MATCHES = tuple((prefix, sorted(key for key in _FILTER_KEYS if key.startswith(prefix)))
+                               for prefix in ('abc', 'b', 'bc', 'zzz', 'x', 'xy', 'qwerty', 'AT+CSCS='))
+
 class TestTrie(unittest.TestCase):
     """ Tests the trie implementation used by GsmTerm """    
     
@@ -71,8 +76,7 @@ class TestTrie(unittest.TestCase):
                 
     def test_storeDeleteMultiple(self):
         self.assertEqual(len(self.trie), 0)
-        for key, value in self.keyValuePairs:
-            self.trie[key] = value
+        self.trie.update(self.keyValuePairs)
         self.assertEqual(len(self.trie), len(self.keyValuePairs))
         n = len(self.trie)
         for key, value in self.keyValuePairs:
@@ -88,6 +92,18 @@ class TestTrie(unittest.TestCase):
             self.trie[key] = value
             self.assertEqual(len(self.trie), n, 'Incorrect trie length. Expected {0}, got {1}. Last entry: {2}: {3}'.format(n, len(self.trie), key, value))
     
+    def test_update(self):
+        """ Tests storing multiple key/value pairs at once """
+        self.trie.update(self.keyValuePairs)
+        self.assertEqual(len(self.trie), len(self.keyValuePairs))
+        for key, value in self.keyValuePairs:
+            self.assertEqual(self.trie[key], value)
+        # Dicts are accepted as well; existing keys are overwritten
+        self.trie.update({'abc': 'xyz', 'new key': 'new value'})
+        self.assertEqual(len(self.trie), len(self.keyValuePairs) + 1)
+        self.assertEqual(self.trie['abc'], 'xyz')
+        self.assertEqual(self.trie['new key'], 'new value')
+    
     def test_contains(self):
         for key, value in self.keyValuePairs:
             self.assertFalse(key in self.trie)
@@ -118,8 +134,7 @@ class TestTrie(unittest.TestCase):
     
     def test_overWrite(self):
         # Fill up trie with some values
-        for key, value in self.keyValuePairs:            
-            self.trie[key] = value
+        self.trie.update(self.keyValuePairs)
         key, oldValue = self.keyValuePairs[0]
         length = len(self.keyValuePairs)
         self.assertEqual(self.trie[key], oldValue)
@@ -135,23 +150,10 @@ class TestTrie(unittest.TestCase):
     
     def test_filteredKeys(self):
         """ Test the "matching keys" functionality of the trie """
-        keys = ('a', 'ab', 'abc', 'abcd0000', 'abcd1111', 'abcd2222', 'abcd3333', 'b000', 'b1111', 'zzz123', 'zzzz1234', 'xyz123', 'AT+CSCS')
-        prefixMatches = (('abc', [key for key in keys if key.startswith('abc')]),
-                         ('b', [key for key in keys if key.startswith('b')]),
-                         ('bc', [key for key in keys if key.startswith('bc')]),
-                         ('zzz', [key for key in keys if key.startswith('zzz')]),
-                         ('x', [key for key in keys if key.startswith('x')]),
-                         ('xy', [key for key in keys if key.startswith('xy')]),
-                         ('qwerty', [key for key in keys if key.startswith('qwerty')]),
-                         ('AT+CSCS=', [key for key in keys if key.startswith('AT+CSCS=')]))
-
-        for key in keys:
-            self.trie[key] = 1
-        for prefix, matchingKeys in prefixMatches:
-            trieKeys = self.trie.keys(prefix)
-            self.assertEqual(len(trieKeys), len(matchingKeys), 'Filtered keys length failed. Prefix: {0}, expected len: {1}, items: {2}, got len {3}, items: {4}'.format(prefix, len(matchingKeys), matchingKeys, len(trieKeys), trieKeys))
-            for key in matchingKeys:
-                self.assertTrue(key in trieKeys, 'Key not in trie keys: {0}. Trie keys: {1}'.format(key, trieKeys))
+        self.trie.update((key, 1) for key in _FILTER_KEYS)
+        for prefix, matchingKeys in _FILTER_PREFIX_MATCHES:
+            # The trie has no concept of ordering; assertEqual() shows both key lists on failure
+            self.assertEqual(sorted(self.trie.keys(prefix)), matchingKeys, 'Filtered keys failed. Prefix: {0}'.format(prefix))
     
     def test_longestCommonPrefix(self):
         """ Test the "get longest common prefix" functionality of the trie """
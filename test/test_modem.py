@@ -4,9 +4,10 @@
 
 from __future__ import print_function
 
-import sys, time, unittest, logging, codecs
+import sys, time, unittest, logging, codecs, threading
 from datetime import datetime
 from copy import copy
+from collections import deque, namedtuple
 
 from . import compat # For Python 2.6 compatibility
 from gsmmodem.exceptions import PinRequiredError, CommandError, InvalidStateException, TimeoutException,\
@@ -45,52 +46,79 @@ class MockSerialPackage(object):
             #self.defaultResponse = 'OK\r\n'
             self.responseSequence = []
             self.flushResponseSequence = True
-            self.writeQueue = []
+            self.writeQueue = deque()
             self._alive = True
-            self._readQueue = []
+            self._readBuffer = bytearray() # encoded response data not yet read
+            # Notified when the read thread asks for more data while nothing is pending
+            self._drained = threading.Condition()
+            # Notified whenever a command is written (or the port is closed), to wake up a blocked reader
+            self._written = threading.Condition()
             global SERIAL_WRITE_CALLBACK_FUNC
             self.writeCallbackFunc = SERIAL_WRITE_CALLBACK_FUNC
             global FAKE_MODEM
             # Pre-determined responses to specific commands - used for imitating specific modems
             if FAKE_MODEM != None:
+                # The copy gets its own response table and state, so FAKE_MODEM can be reused for the next connection
                 self.modem = copy(FAKE_MODEM)
             else:
                 self.modem = fakemodems.GenericTestModem()
         
-        def read(self, timeout=None):
-            if len(self._readQueue) > 0:    
-                return self._readQueue.pop(0)                        
-            elif len(self.writeQueue) > 0:  
-                self._setupReadValue(self.writeQueue.pop(0))
-                if len(self._readQueue) > 0:
-                    return self._readQueue.pop(0)
-            elif self.flushResponseSequence and len(self.responseSequence) > 0:
+        def read(self, size=None):
+            """ Returns up to size bytes of the current response line (the whole line if size is None)
+            
+            If nothing is available, returns an empty string after a short pause (or, if size is None, blocks until a command is written)
+            """
+            if not self._readBuffer and not self.responseSequence:
+                # Everything read so far has been handled by the read thread
+                with self._drained:
+                    self._drained.notify_all()
+            if self._readBuffer:    
+                return self._readChunk(size)
+            elif self.writeQueue:  
+                self._setupReadValue(self.writeQueue.popleft())
+                if self._readBuffer:
+                    return self._readChunk(size)
+            elif self.flushResponseSequence and self.responseSequence:
                 self._setupReadValue(None)
             
-            if timeout != None:
-                time.sleep(0.001)
-                return ''
+            if size != None:
+                # Idle; pause briefly (or until a command is written) so that the read thread does not spin
+                with self._written:
+                    if not self.writeQueue:
+                        self._written.wait(0.001)
+                return b''
             else:
                 while self._alive:
-                    if len(self.writeQueue) > 0:
-                        self._setupReadValue(self.writeQueue.pop(0))
-                        if len(self._readQueue) > 0:
-                            return self._readQueue.pop(0)
-                    time.sleep(0.05)
+                    if self.writeQueue:
+                        self._setupReadValue(self.writeQueue.popleft())
+                        if self._readBuffer:
+                            return self._readChunk(size)
+                    with self._written:
+                        if self._alive and not self.writeQueue:
+                            self._written.wait(0.5)
+
+        def _readChunk(self, size):
+            if size == None:
+                size = len(self._readBuffer)
+            # Anything beyond size is left in the buffer for the next read
+            data = bytes(self._readBuffer[:size])
+            del self._readBuffer[:size]
+            return data
                     
         def _setupReadValue(self, command):
-            if len(self._readQueue) == 0:
-                if len(self.responseSequence) > 0:
+            if not self._readBuffer:
+                if self.responseSequence:
                     value = self.responseSequence.pop(0)    
-                    if type(value) in (float, int):
+                    if isinstance(value, (int, float)):
                         time.sleep(value)                        
-                        if len(self.responseSequence) > 0:                            
+                        if self.responseSequence:                            
                             self._setupReadValue(command)                    
-                    else:                        
-                        self._readQueue = list(value)
+                    else:
+                        # Real serial ports return bytes; the whole line is handed out in as few reads as the reader allows
+                        self._readBuffer.extend(value.encode('latin-1'))
                 else:
-                    self.responseSequence = self.modem.getResponse(command)
-                    if len(self.responseSequence) > 0:
+                    self.responseSequence = list(self.modem.getResponse(command))
+                    if self.responseSequence:
                         self._setupReadValue(command)
                 #elif command in self.modem.responses:
                 #    self.responseSequence = self.modem.responses[command]
@@ -102,15 +130,29 @@ class MockSerialPackage(object):
         def write(self, data):            
             if self.writeCallbackFunc != None:
                 self.writeCallbackFunc(data)
-            self.writeQueue.append(data)
+            with self._written:
+                self.writeQueue.append(data)
+                self._written.notify_all()
             
         def close(self):
-            pass
+            with self._written:
+                self._alive = False
+                self._written.notify_all()
+
+        def waitForDrain(self, timeout=5):
+            """ Blocks until the read thread has consumed all pending response data (or the timeout expires) """
+            endTime = time.time() + timeout
+            with self._drained:
+                while self._readBuffer or self.responseSequence:
+                    timeLeft = endTime - time.time()
+                    if timeLeft <= 0:
+                        break
+                    self._drained.wait(timeLeft)
             
         def inWaiting(self):
-            rqLen = len(self._readQueue)
+            rqLen = len(self._readBuffer)
             for item in self.responseSequence:
-                if type(item) in (int, float):
+                if isinstance(item, (int, float)):
                     break
                 else:
                     rqLen += len(item)
@@ -121,6 +163,65 @@ class MockSerialPackage(object):
         """ Mock Serial Exception """
 
 
+class ReadStoredSmsWriteCallback(object):
+    """ Mock serial write callback that checks the commands written by the modem to read (and delete) a newly-received SMS
+    
+    Expects an AT+CPMS command (only if the modem needs to change its read memory), followed by AT+CMGR and AT+CMGD;
+    cmgrResponse is queued as the modem's response to the AT+CMGR command
+    """
+    
+    def __init__(self, testCase, modem, mem, index, cmgrResponse):
+        self.testCase = testCase
+        self.modem = modem
+        self.mem = mem
+        self.cmgrResponse = cmgrResponse
+        self.expected = ('AT+CPMS="{0}"\r'.format(mem), 'AT+CMGR={0}\r'.format(index), 'AT+CMGD={0},0\r'.format(index))
+        # Index into self.expected of the next command the modem should write
+        self.state = 0
+    
+    def __call__(self, data):
+        if self.state == 0 and self.modem._smsMemReadDelete == self.mem:
+            # Modem does not need to change read memory
+            self.state = 1
+        expected = self.expected[self.state]
+        if data != expected:
+            self.testCase.fail('Invalid data written to modem; expected "{0}", got: "{1}"'.format(expected[:-1], data))
+        if self.state == 1:
+            self.modem.serial.responseSequence = self.cmgrResponse
+        if self.state < 2:
+            self.state += 1
+
+
+class CallStatusEvents(object):
+    """ Call status update callback (see GsmModem.dial()) that sets threading.Events when the call is answered or ended """
+    
+    def __init__(self):
+        self.answered = threading.Event()
+        self.ended = threading.Event()
+        # The thread that reported the end of the call
+        self.endedBy = None
+    
+    def __call__(self, call):
+        if call.answered:
+            self.answered.set()
+        else:
+            self.endedBy = threading.current_thread()
+            self.ended.set()
+    
+    def waitForEnded(self, timeout=5):
+        """ Waits for the call to end, and for the thread that ended it to finish updating the call's state
+        
+        (the callback is executed while that thread is still busy marking the call inactive)
+        
+        :return: True if the call ended within the timeout, False otherwise
+        """
+        if not self.ended.wait(timeout):
+            return False
+        if self.endedBy != threading.current_thread():
+            self.endedBy.join(timeout)
+        return True
+
+
 class TestGsmModemGeneralApi(unittest.TestCase):
     """ Tests the API of GsmModem class (excluding connect/close) """
     
@@ -136,7 +237,8 @@ class TestGsmModemGeneralApi(unittest.TestCase):
         
     def test_manufacturer(self):
         def writeCallbackFunc(data):
-            self.assertEqual('AT+CGMI\r', data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CGMI\r', data))
+            if data != 'AT+CGMI\r':
+                self.fail('Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CGMI\r', data))
         self.modem.serial.writeCallbackFunc = writeCallbackFunc
         tests = ['huawei', 'ABCDefgh1235', 'Some Random Manufacturer']
         for test in tests:
@@ -145,7 +247,8 @@ class TestGsmModemGeneralApi(unittest.TestCase):
     
     def test_model(self):
         def writeCallbackFunc(data):
-            self.assertEqual('AT+CGMM\r', data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CGMM\r', data))
+            if data != 'AT+CGMM\r':
+                self.fail('Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CGMM\r', data))
         self.modem.serial.writeCallbackFunc = writeCallbackFunc
         tests = ['K3715', '1324-Qwerty', 'Some Random Model']
         for test in tests:
@@ -154,19 +257,21 @@ class TestGsmModemGeneralApi(unittest.TestCase):
             
     def test_revision(self):
         def writeCallbackFunc(data):
-            self.assertEqual('AT+CGMR\r', data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CGMR\r', data))
+            if data != 'AT+CGMR\r':
+                self.fail('Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CGMR\r', data))
         self.modem.serial.writeCallbackFunc = writeCallbackFunc
         tests = ['1', '1324-56768-23414', 'r987']
         for test in tests:
             self.modem.serial.responseSequence = ['{0}\r\n'.format(test), 'OK\r\n']
             self.assertEqual(test, self.modem.revision)
         # Fake a modem that does not support this command
-        self.modem.serial.modem.defaultResponse = ['ERROR\r\n']
+        self.modem.serial.modem.defaultResponse = ('ERROR\r\n',)
         self.assertEqual(None, self.modem.revision)
     
     def test_imei(self):
         def writeCallbackFunc(data):
-            self.assertEqual('AT+CGSN\r', data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CGSN\r', data))
+            if data != 'AT+CGSN\r':
+                self.fail('Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CGSN\r', data))
         self.modem.serial.writeCallbackFunc = writeCallbackFunc
         tests = ['012345678912345']
         for test in tests:
@@ -175,7 +280,8 @@ class TestGsmModemGeneralApi(unittest.TestCase):
             
     def test_imsi(self):
         def writeCallbackFunc(data):
-            self.assertEqual('AT+CIMI\r', data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CIMI\r', data))
+            if data != 'AT+CIMI\r':
+                self.fail('Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CIMI\r', data))
         self.modem.serial.writeCallbackFunc = writeCallbackFunc
         tests = ['987654321012345']
         for test in tests:
@@ -396,7 +502,6 @@ class TestUssd(unittest.TestCase):
                 ussd.cancel()
             else:
                 ussd.cancel() # This call shouldn't do anything
-            del ussd
             
     def test_sendUssd_differentModems(self):
         """ Tests sendUssd functionality with different modem behaviours (some modems require mode switching) """
@@ -453,7 +558,6 @@ class TestUssd(unittest.TestCase):
                 ussd.cancel()
             else:
                 ussd.cancel() # This call shouldn't do anything
-            del ussd
     
     def test_sendUssdExtraRelease(self):
         """ Some modems send an extra +CUSD: 2 message when the USSD session is released - see issue #14 on github """
@@ -482,9 +586,10 @@ class TestUssd(unittest.TestCase):
         
     def test_sendUssdExtraLinesInResponse(self):
         """ Test parsing USSD response if it contains extra unsolicited notifications """
-        tests = (('Notification appended', ['OK\r\n', 0.1, '+CUSD: 2,"Notification appended",15\r\n', 'Some random notification!\r\n']),
-                 ('Notification prepended', ['OK\r\n', 0.1, 'Another random notification!\r\n', '+CUSD: 2,"Notification prepended",15\r\n']),
-                 ('Notification before OK', ['Yet another random notification!\r\n', 'OK\r\n', 0.1, '+CUSD: 2,"Notification before OK",15\r\n']))
+        # The short pause in each response sequence makes the +CUSD line arrive separately from the command response
+        tests = (('Notification appended', ['OK\r\n', 0.01, '+CUSD: 2,"Notification appended",15\r\n', 'Some random notification!\r\n']),
+                 ('Notification prepended', ['OK\r\n', 0.01, 'Another random notification!\r\n', '+CUSD: 2,"Notification prepended",15\r\n']),
+                 ('Notification before OK', ['Yet another random notification!\r\n', 'OK\r\n', 0.01, '+CUSD: 2,"Notification before OK",15\r\n']))
         for message, responseSeq in tests:
             self.modem.serial.responseSequence = responseSeq
             ussd = self.modem.sendUssd('*101#')
@@ -507,7 +612,7 @@ class TestEdgeCases(unittest.TestCase):
         for test in tests:
             for fakeModem in fakemodems.createModems():
                 # Init modem and preload SMSC number
-                fakeModem.smscNumber = test
+                fakeModem.setSmscNumber(test)
                 fakeModem.simBusyErrorCounter = 3 # Enable "SIM busy" errors for modem for more accurate testing
                 FAKE_MODEM = fakeModem
                 mockSerial = MockSerialPackage()
@@ -523,7 +628,7 @@ class TestEdgeCases(unittest.TestCase):
         """ Tests case where a modem's functionality setting is 0 at startup """
         global FAKE_MODEM
         for fakeModem in fakemodems.createModems():
-            fakeModem.cfun = 0
+            fakeModem.setCfun(0)
             FAKE_MODEM = fakeModem        
             # This should pass without any problem, and AT+CFUN=1 should be set during connect()
             cfunWritten = [False]
@@ -544,8 +649,8 @@ class TestEdgeCases(unittest.TestCase):
     def test_cfunNotSupported(self):
         """ Tests case where a modem does not support the AT+CFUN command """
         global FAKE_MODEM            
-        FAKE_MODEM = copy(fakemodems.GenericTestModem())
-        FAKE_MODEM.cfun = -1 # disable
+        FAKE_MODEM = fakemodems.GenericTestModem()
+        FAKE_MODEM.setCfun(-1) # disable
         FAKE_MODEM.responses['AT+CFUN?\r'] = ['ERROR\r\n']
         FAKE_MODEM.responses['AT+CFUN=1\r'] = ['ERROR\r\n']
         # This should pass without any problem, and AT+CFUN? should at least have been checked during connect()
@@ -567,7 +672,7 @@ class TestEdgeCases(unittest.TestCase):
     def test_commandNotSupported(self):
         """ Some Huawei modems response with "COMMAND NOT SUPPORT" instead of "ERROR" or "OK"; ensure we detect this """
         global FAKE_MODEM
-        FAKE_MODEM = copy(fakemodems.GenericTestModem())
+        FAKE_MODEM = fakemodems.GenericTestModem()
         FAKE_MODEM.responses['AT+WIND?\r'] = ['COMMAND NOT SUPPORT\r\n']
         mockSerial = MockSerialPackage()
         gsmmodem.serial_comms.serial = mockSerial
@@ -582,7 +687,7 @@ class TestEdgeCases(unittest.TestCase):
         - this is mostly to attain 100% code coverage in tests
         """
         global FAKE_MODEM
-        FAKE_MODEM = copy(fakemodems.WavecomMultiband900E1800())
+        FAKE_MODEM = fakemodems.WavecomMultiband900E1800()
         # Test the case where AT+CLAC returns a response for Wavecom devices, and it includes +WIND and +VTS
         FAKE_MODEM.responses['AT+CLAC\r'] = ['+CLAC: D,+CUSD,+WIND,+VTS\r\n', 'OK\r\n']
         # Test the case where the +WIND setting is already what we want it to be
@@ -595,15 +700,23 @@ class TestEdgeCases(unittest.TestCase):
         modem.close()
         FAKE_MODEM = None
 
+    def test_wavecomCfunWhileDeviceBusy(self):
+        """ Tests that the Wavecom fake modem still answers AT+CFUN=1 while it is emulating "device busy" errors """
+        fakeModem = fakemodems.WavecomMultiband900E1800()
+        fakeModem.deviceBusyErrorCounter = 1
+        self.assertEqual(list(fakeModem.getResponse('AT+CFUN=1\r')), ['OK\r\n'])
+        self.assertEqual(fakeModem.deviceBusyErrorCounter, 2)
+        self.assertEqual(list(fakeModem.getResponse('AT+CGMI\r')), ['+CME ERROR: 515\r\n'])
+        self.assertEqual(fakeModem.deviceBusyErrorCounter, 1)
+
     def test_zteConnectSpecifics(self):
         """ ZTE-specific test cases that might not be covered by the modem profiles in fakemodems.py
         - this is mostly to attain 100% code coverage in tests
         """
         global FAKE_MODEM
-        FAKE_MODEM = copy(fakemodems.ZteK3565Z())
+        FAKE_MODEM = fakemodems.ZteK3565Z()
         # Test the case where AT+CLAC returns a response for ZTE devices, and it includes +ZPAS and +VTS
-        FAKE_MODEM.responses['AT+CLAC\r'][-1] = '+ZPAS\r\n'
-        FAKE_MODEM.responses['AT+CLAC\r'].append('OK\r\n')
+        FAKE_MODEM.responses['AT+CLAC\r'] = FAKE_MODEM.responses['AT+CLAC\r'][:-1] + ('+ZPAS\r\n', 'OK\r\n')
         mockSerial = MockSerialPackage()
         gsmmodem.serial_comms.serial = mockSerial
         modem = gsmmodem.modem.GsmModem('-- PORT IGNORED DURING TESTS --')
@@ -617,7 +730,7 @@ class TestEdgeCases(unittest.TestCase):
         - this is mostly to attain 100% code coverage in tests
         """
         global FAKE_MODEM
-        FAKE_MODEM = copy(fakemodems.HuaweiK3715())
+        FAKE_MODEM = fakemodems.HuaweiK3715()
         # Test the case where AT+CLAC returns no response for Huawei devices; causing the need for other methods to detect phone type
         FAKE_MODEM.responses['AT+CLAC\r'] = ['ERROR\r\n']
         mockSerial = MockSerialPackage()
@@ -633,8 +746,8 @@ class TestEdgeCases(unittest.TestCase):
         """ Tests connect() operation when an SMSC number is set before connect() is called """
         smscNumber = '123454321'
         global FAKE_MODEM
-        FAKE_MODEM = copy(fakemodems.GenericTestModem())
-        FAKE_MODEM.smsc = None
+        FAKE_MODEM = fakemodems.GenericTestModem()
+        FAKE_MODEM.setSmscNumber(None)
         mockSerial = MockSerialPackage()
         gsmmodem.serial_comms.serial = mockSerial
         modem = gsmmodem.modem.GsmModem('-- PORT IGNORED DURING TESTS --')
@@ -657,7 +770,7 @@ class TestEdgeCases(unittest.TestCase):
     def test_cpmsNotSupported(self):
         """ Tests case where a modem does not support the AT+CPMS command """
         global FAKE_MODEM            
-        FAKE_MODEM = copy(fakemodems.GenericTestModem())
+        FAKE_MODEM = fakemodems.GenericTestModem()
         FAKE_MODEM.responses['AT+CPMS=?\r'] = ['+CMS ERROR: 302\r\n']
         # This should pass without any problem, and AT+CPMS=? should at least have been checked during connect()
         cpmsWritten = [False]
@@ -678,7 +791,7 @@ class TestEdgeCases(unittest.TestCase):
     def test_cnmiNotSupported(self):
         """ Tests case where a modem does not support the AT+CNMI command (but does support other SMS-related commands) """
         global FAKE_MODEM            
-        FAKE_MODEM = copy(fakemodems.GenericTestModem())
+        FAKE_MODEM = fakemodems.GenericTestModem()
         FAKE_MODEM.responses['AT+CNMI=2,1,0,2\r'] = ['ERROR\r\n']
         # This should pass without any problem, and AT+CNMI=2,1,0,2 should at least have been attempted during connect()
         cnmiWritten = [False]
@@ -700,7 +813,7 @@ class TestEdgeCases(unittest.TestCase):
     def test_clipNotSupported(self):
         """ Tests case where a modem does not support the AT+CLIP command """
         global FAKE_MODEM            
-        FAKE_MODEM = copy(fakemodems.GenericTestModem())
+        FAKE_MODEM = fakemodems.GenericTestModem()
         FAKE_MODEM.responses['AT+CLIP=1\r'] = ['ERROR\r\n']
         # This should pass without any problem, and AT+CLIP=1 should at least have been attempted during connect()
         clipWritten = [False]
@@ -727,7 +840,7 @@ class TestEdgeCases(unittest.TestCase):
     def test_crcNotSupported(self):
         """ Tests case where a modem does not support the AT+CRC command """
         global FAKE_MODEM            
-        FAKE_MODEM = copy(fakemodems.GenericTestModem())
+        FAKE_MODEM = fakemodems.GenericTestModem()
         FAKE_MODEM.responses['AT+CRC=1\r'] = ['ERROR\r\n']
         # This should pass without any problem, and AT+CRC=1 should at least have been attempted during connect()
         clipWritten = [False]
@@ -781,22 +894,28 @@ class TestGsmModemDial(unittest.TestCase):
             modem = self.modem.serial.modem # load the copy()-ed modem instance
             
             for number, callId, callType in tests:
+                expectedAtd = 'ATD{0};\r'.format(number)
+                # Set whenever the modem polls the call status
+                clccPolled = threading.Event()
+                def clccCallback(data):
+                    if data.startswith('AT+CLCC'):
+                        clccPolled.set()
                 def writeCallbackFunc(data):
                     if self.modem._mustPollCallStatus and data.startswith('AT+CLCC'):
+                        clccPolled.set()
                         return # Can happen due to polling
-                    self.assertEqual('ATD{0};\r'.format(number), data, 'Invalid data written to modem; expected "{0}", got: "{1}". Modem: {2}'.format('ATD{0};'.format(number), data[:-1] if data[-1] == '\r' else data, modem))
-                    self.modem.serial.writeCallbackFunc = None
+                    if data != expectedAtd:
+                        self.fail('Invalid data written to modem; expected "{0}", got: "{1}". Modem: {2}'.format(expectedAtd[:-1], data[:-1] if data[-1] == '\r' else data, modem))
+                    self.modem.serial.writeCallbackFunc = clccCallback
                 self.modem.serial.writeCallbackFunc = writeCallbackFunc                
-                self.modem.serial.responseSequence = modem.getAtdResponse(number)
+                self.modem.serial.responseSequence = list(modem.getAtdResponse(number))
                 self.modem.serial.responseSequence.extend(modem.getPreCallInitWaitSequence())
                 # Fake call initiated notification
                 self.modem.serial.responseSequence.extend(modem.getCallInitNotification(callId, callType))
-                call = self.modem.dial(number)
+                callEvents = CallStatusEvents()
+                call = self.modem.dial(number, callStatusUpdateCallbackFunc=callEvents)
                 # Wait for the read buffer to clear
-                while len(self.modem.serial._readQueue) > 0 or len(self.modem.serial.responseSequence) > 0:
-                    time.sleep(0.05)
-                if self.modem._mustPollCallStatus:
-                    time.sleep(0.6)
+                self.modem.serial.waitForDrain()
                 self.assertIsInstance(call, gsmmodem.modem.Call)
                 self.assertIs(call.number, number)
                 # Check status
@@ -805,20 +924,15 @@ class TestGsmModemDial(unittest.TestCase):
                 self.assertIn(call.id, self.modem.activeCalls)
                 self.assertEqual(len(self.modem.activeCalls), 1)
                 # Fake an answer
-                self.modem.serial.responseSequence = modem.getRemoteAnsweredNotification(callId, callType)
-                # Wait a bit for the event to be picked up
-                while len(self.modem.serial._readQueue) > 0 or len(self.modem.serial.responseSequence) > 0:                    
-                    time.sleep(0.05)
-                if self.modem._mustPollCallStatus:
-                    time.sleep(0.6) # Ensure polling picks up event
-                elif not self.modem._waitForCallInitUpdate:
-                    time.sleep(0.1) # Ensure event is picked up
-                self.assertTrue(call.answered, 'Remote call answer was not detected. Modem: {0}'.format(modem))
+                self.modem.serial.responseSequence = list(modem.getRemoteAnsweredNotification(callId, callType))
+                self.assertTrue(callEvents.answered.wait(5), 'Remote call answer was not detected. Modem: {0}'.format(modem))
                 self.assertTrue(call.active, 'Call state invalid: should be active. Modem: {0}'.format(modem))
                 def hangupCallback(data):
                     if self.modem._mustPollCallStatus and data.startswith('AT+CLCC'):
+                        clccPolled.set()
                         return # Can happen due to polling
-                    self.assertEqual('ATH\r'.format(number), data, 'Invalid data written to modem; expected "{0}", got: "{1}". Modem: {2}'.format('ATH'.format(number), data[:-1] if data[-1] == '\r' else data, modem))
+                    if data != 'ATH\r':
+                        self.fail('Invalid data written to modem; expected "{0}", got: "{1}". Modem: {2}'.format('ATH', data[:-1] if data[-1] == '\r' else data, modem))
                 self.modem.serial.writeCallbackFunc = hangupCallback
                 call.hangup()
                 self.assertFalse(call.answered, 'Hangup call did not change answered state. Modem: {0}'.format(modem))
@@ -828,35 +942,23 @@ class TestGsmModemDial(unittest.TestCase):
 
                 ############## Check remote hangup detection ###############
                 self.modem.serial.writeCallbackFunc = writeCallbackFunc
-                self.modem.serial.responseSequence = modem.getAtdResponse(number)
+                self.modem.serial.responseSequence = list(modem.getAtdResponse(number))
                 self.modem.serial.responseSequence.extend(modem.getPreCallInitWaitSequence())
                 # Fake call initiated notification
                 self.modem.serial.responseSequence.extend(modem.getCallInitNotification(callId, callType))                
-                call = self.modem.dial(number)
+                callEvents = CallStatusEvents()
+                call = self.modem.dial(number, callStatusUpdateCallbackFunc=callEvents)
                 self.assertTrue(call.active, 'Call state invalid: should be active. Modem: {0}'.format(modem))
                 # Wait a bit for the event to be picked up
-                while len(self.modem.serial._readQueue) > 0 or len(self.modem.serial.responseSequence) > 0:
-                    time.sleep(0.05)
-                if self.modem._mustPollCallStatus:
-                    time.sleep(0.6) # Ensure polling picks up event
+                self.modem.serial.waitForDrain()
                 # Fake remote answer
-                self.modem.serial.responseSequence = modem.getRemoteAnsweredNotification(callId, callType)
-                while len(self.modem.serial._readQueue) > 0 or len(self.modem.serial.responseSequence) > 0:
-                    time.sleep(0.05)
-                if self.modem._mustPollCallStatus:
-                    time.sleep(0.5) # Ensure polling picks up event
-                elif not self.modem._waitForCallInitUpdate:
-                    time.sleep(0.1) # Ensure event is picked up
-                self.assertTrue(call.answered, 'Remote call answer was not detected. Modem: {0}'.format(modem))
+                self.modem.serial.responseSequence = list(modem.getRemoteAnsweredNotification(callId, callType))
+                self.assertTrue(callEvents.answered.wait(5), 'Remote call answer was not detected. Modem: {0}'.format(modem))
                 self.assertIn(call.id, self.modem.activeCalls)
                 self.assertEqual(len(self.modem.activeCalls), 1)
                 # Now fake a remote hangup
-                self.modem.serial.responseSequence = modem.getRemoteHangupNotification(callId, callType)
-                # Wait a bit for the event to be picked up
-                while len(self.modem.serial._readQueue) > 0 or len(self.modem.serial.responseSequence) > 0:
-                    time.sleep(0.05)
-                if self.modem._mustPollCallStatus:
-                    time.sleep(0.6) # Ensure polling picks up event
+                self.modem.serial.responseSequence = list(modem.getRemoteHangupNotification(callId, callType))
+                self.assertTrue(callEvents.waitForEnded(5), 'Remote hangup was not detected. Modem: {0}'.format(modem))
                 self.assertFalse(call.answered, 'Remote hangup was not detected. Modem: {0}'.format(modem))
                 self.assertFalse(call.active, 'Call state invalid: should not be active (remote hangup). Modem: {0}'.format(modem))
                 self.assertNotIn(call.id, self.modem.activeCalls)
@@ -864,28 +966,24 @@ class TestGsmModemDial(unittest.TestCase):
 
                 ############## Check remote call rejection (hangup before answering) ###############
                 self.modem.serial.writeCallbackFunc = writeCallbackFunc
-                self.modem.serial.responseSequence = modem.getAtdResponse(number)
+                self.modem.serial.responseSequence = list(modem.getAtdResponse(number))
                 self.modem.serial.responseSequence.extend(modem.getPreCallInitWaitSequence())
                 # Fake call initiated notification
                 self.modem.serial.responseSequence.extend(modem.getCallInitNotification(callId, callType))
-                call = self.modem.dial(number)
+                callEvents = CallStatusEvents()
+                call = self.modem.dial(number, callStatusUpdateCallbackFunc=callEvents)
                 self.assertTrue(call.active, 'Call state invalid: should be active. Modem: {0}'.format(modem))
-                # Wait a bit for the event to be picked up
-                while len(self.modem.serial._readQueue) > 0 or len(self.modem.serial.responseSequence) > 0:
-                    time.sleep(0.05)
                 if self.modem._mustPollCallStatus:
-                    time.sleep(0.6) # Ensure polling picks up event
+                    # Let the modem poll the (unanswered) call status; a poll is only written once the previous one has been handled
+                    for i in range(2):
+                        clccPolled.clear()
+                        self.assertTrue(clccPolled.wait(2), 'Call status was not polled with AT+CLCC. Modem: {0}'.format(modem))
                 self.assertFalse(call.answered, 'Call should not have been in "answered" state. Modem: {0}'.format(modem))
                 self.assertIn(call.id, self.modem.activeCalls)
                 self.assertEqual(len(self.modem.activeCalls), 1)
                 # Now reject the call
-                self.modem.serial.responseSequence = modem.getRemoteRejectCallNotification(callId, callType)
-                # Wait a bit for the event to be picked up
-                while len(self.modem.serial._readQueue) > 0 or len(self.modem.serial.responseSequence) > 0:
-                    time.sleep(0.05)
-                if self.modem._mustPollCallStatus:
-                    time.sleep(0.6) # Ensure polling picks up event
-                time.sleep(0.05)
+                self.modem.serial.responseSequence = list(modem.getRemoteRejectCallNotification(callId, callType))
+                self.assertTrue(callEvents.waitForEnded(5), 'Remote call rejection was not detected. Modem: {0}'.format(modem))
                 self.assertFalse(call.answered, 'Call state invalid: should not be answered (remote call rejection). Modem: {0}'.format(modem))
                 self.assertFalse(call.active, 'Call state invalid: should not be active (remote rejection). Modem: {0}'.format(modem))
                 self.assertNotIn(call.id, self.modem.activeCalls)
@@ -926,7 +1024,7 @@ class TestGsmModemDial(unittest.TestCase):
                     self.assertTrue(call.active, 'Call state invalid: should be active. Modem: {0}'.format(modem))
                     self.assertFalse(call.answered, 'Call state invalid: should not yet be answered. Modem: {0}'.format(modem))
                     # Fake an answer...
-                    self.modem.serial.responseSequence = modem.getRemoteAnsweredNotification(callId, callType)
+                    self.modem.serial.responseSequence = list(modem.getRemoteAnsweredNotification(callId, callType))
                     # ...and wait for the callback to be called
                     while not callbackVars[1]:
                         time.sleep(0.05)
@@ -936,7 +1034,7 @@ class TestGsmModemDial(unittest.TestCase):
                     # Fake remote hangup...
                     callbackVars[1] = False
                     callbackVars[2] = 1
-                    self.modem.serial.responseSequence = modem.getRemoteAnsweredNotification(callId, callType)
+                    self.modem.serial.responseSequence = list(modem.getRemoteAnsweredNotification(callId, callType))
                     # ...and wait for the callback to be called
                     while not callbackVars[1]:
                         time.sleep(0.05)
@@ -989,7 +1087,7 @@ class TestGsmModemPinConnect(unittest.TestCase):
         """ Test connecting to the modem with a SIM PIN code - no PIN specified"""
         testModems = fakemodems.createModems()
         for modem in testModems:
-            modem.pinLock = True
+            modem.setPinLock(True)
             self.init_modem(modem)
             self.assertRaises(PinRequiredError, self.modem.connect)
             self.modem.close()
@@ -998,11 +1096,13 @@ class TestGsmModemPinConnect(unittest.TestCase):
         """ Test connecting to the modem with a SIM PIN code - PIN specified"""
         testModems = fakemodems.createModems()
         # Also test a modem that allows only CMEE commands before PIN is entered
-        edgeCaseModem = fakemodems.GenericTestModem()
-        edgeCaseModem.commandsNoPinRequired = ['AT+CMEE=1\r']
+        class EdgeCaseModem(fakemodems.GenericTestModem):
+            __slots__ = ()
+            commandsNoPinRequired = frozenset(['AT+CMEE=1\r'])
+        edgeCaseModem = EdgeCaseModem()
         testModems.append(edgeCaseModem)
         for modem in testModems:
-            modem.pinLock = True
+            modem.setPinLock(True)
             self.init_modem(modem)
             # This should succeed
             try:
@@ -1021,7 +1121,7 @@ class TestGsmModemPinConnect(unittest.TestCase):
         global SERIAL_WRITE_CALLBACK_FUNC
         SERIAL_WRITE_CALLBACK_FUNC = writeCallbackFunc
         fakeModem = fakemodems.GenericTestModem()
-        fakeModem.pinLock = True
+        fakeModem.setPinLock(True)
         self.init_modem(fakeModem)
         self.assertRaises(gsmmodem.exceptions.IncorrectPinError, self.modem.connect, **{'pin': '1234'})
         self.modem.close()
@@ -1036,7 +1136,7 @@ class TestGsmModemPinConnect(unittest.TestCase):
         global SERIAL_WRITE_CALLBACK_FUNC
         SERIAL_WRITE_CALLBACK_FUNC = writeCallbackFunc
         fakeModem = fakemodems.GenericTestModem()
-        fakeModem.pinLock = True
+        fakeModem.setPinLock(True)
         self.init_modem(fakeModem)
         self.assertRaises(gsmmodem.exceptions.PukRequiredError, self.modem.connect, **{'pin': '1234'})
         self.modem.close()
@@ -1056,7 +1156,7 @@ class TestGsmModemPinConnect(unittest.TestCase):
             global SERIAL_WRITE_CALLBACK_FUNC
             SERIAL_WRITE_CALLBACK_FUNC = writeCallbackFunc
             fakeModem = fakemodems.GenericTestModem()
-            fakeModem.pinLock = False
+            fakeModem.setPinLock(False)
             self.init_modem(fakeModem)
             if shouldTimeout:
                 self.assertRaises(gsmmodem.exceptions.TimeoutException, self.modem.connect)
@@ -1084,7 +1184,7 @@ class TestIncomingCall(unittest.TestCase):
     def test_incomingCallAnswer(self):
 
         for modem in fakemodems.createModems():
-            callReceived = [False, 'VOICE', '']
+            callReceived = [threading.Event(), 'VOICE', '']
             def incomingCallCallbackFunc(call):
                 try:                    
                     self.assertIsInstance(call, gsmmodem.modem.IncomingCall)
@@ -1116,21 +1216,20 @@ class TestIncomingCall(unittest.TestCase):
                     self.modem.serial.writeCallbackFunc = writeCallbackShouldNotBeCalled
                     call.hangup()
                 finally:
-                    callReceived[0] = True
+                    callReceived[0].set()
         
             self.init_modem(modem, incomingCallCallbackFunc)
         
             tests = (('+27820001234', 'VOICE', 0),)
         
             for number, cringParam, callType in tests:
-                callReceived[0] = False
+                callReceived[0].clear()
                 callReceived[1] = callType
                 callReceived[2] = number
                 # Fake incoming voice call                
-                self.modem.serial.responseSequence = modem.getIncomingCallNotification(number, cringParam)
+                self.modem.serial.responseSequence = list(modem.getIncomingCallNotification(number, cringParam))
                 # Wait for the handler function to finish
-                while callReceived[0] == False:
-                    time.sleep(0.05)
+                self.assertTrue(callReceived[0].wait(5), 'Incoming call handler not called. Modem: {0}'.format(modem))
             self.modem.close()
     
     def test_incomingCallCrcNotSupported(self):
@@ -1141,7 +1240,7 @@ class TestIncomingCall(unittest.TestCase):
             self.assertEqual(call.type, None, 'Invalid call type; expected "{0}", got "{1}".'.format(None, call.type))
             callReceived[0] = True
         
-        testModem = copy(fakemodems.GenericTestModem())
+        testModem = fakemodems.GenericTestModem()
         testModem.responses['AT+CRC?\r'] = ['ERROR\r\n']
         testModem.responses['AT+CRC=1\r'] = ['ERROR\r\n']
         self.init_modem(testModem, incomingCallCallbackFunc=callbackFunc)
@@ -1265,30 +1364,47 @@ class TestCall(unittest.TestCase):
         self.modem.close()
 
 
+# A single SMS used by the TestSms send/receive tests; smsc, pdu and tpduLength describe the message as an SMS-DELIVER PDU
+# (smsc and pdu are None if the message can't be used for PDU-mode tests), and ref is the reference used when sending it
+SmsTest = namedtuple('SmsTest', 'number message index smsTime smsc pdu tpduLength ref mem')
+
+SMS_TESTS = (SmsTest('+0123456789', 'Hello world!',
+                     1,
+                     datetime(2013, 3, 8, 15, 2, 16, tzinfo=SimpleOffsetTzInfo(2)),
+                     '+2782913593',
+                     '06917228195339040A9110325476980000313080512061800CC8329BFD06DDDF72363904', 29, 142,
+                     'SM'),
+             SmsTest('+9876543210',
+                     'Hallo\nhoe gaan dit?',
+                     4,
+                     datetime(2013, 3, 8, 15, 2, 16, tzinfo=SimpleOffsetTzInfo(2)),
+                     '+2782913593',
+                     '06917228195339040A91896745230100003130805120618013C8309BFD56A0DF65D0391C7683C869FA0F', 35, 33,
+                     'SM'),
+             SmsTest('+353870000000', 'My message',
+                     13,
+                     datetime(2013, 4, 20, 20, 22, 27, tzinfo=SimpleOffsetTzInfo(4)),
+                     None, None, 0, 0, 'ME'),
+             )
+# address_text data to use for tests when testing PDU mode
+SMS_PDU_ADDRESS_TEXTS = ('', '"abc123"', '""', 'Test User 123', '9876543231')
+
 class TestSms(unittest.TestCase):
     """ Tests the SMS API of GsmModem class """
     
-    def setUp(self):
-        self.tests = (('+0123456789', 'Hello world!',                        
-                       1,
-                       datetime(2013, 3, 8, 15, 2, 16, tzinfo=SimpleOffsetTzInfo(2)),
-                       '+2782913593',
-                       '06917228195339040A9110325476980000313080512061800CC8329BFD06DDDF72363904', 29, 142,
-                       'SM'),
-                      ('+9876543210', 
-                       'Hallo\nhoe gaan dit?', 
-                       4,
-                       datetime(2013, 3, 8, 15, 2, 16, tzinfo=SimpleOffsetTzInfo(2)),
-                       '+2782913593',
-                       '06917228195339040A91896745230100003130805120618013C8309BFD56A0DF65D0391C7683C869FA0F', 35, 33, 
-                       'SM'),
-                      ('+353870000000', 'My message',
-                       13,
-                       datetime(2013, 4, 20, 20, 22, 27, tzinfo=SimpleOffsetTzInfo(4)),
-                       None, None, 0, 0, 'ME'),
-                      )
-        # address_text data to use for tests when testing PDU mode
-        self.testsPduAddressText = ('', '"abc123"', '""', 'Test User 123', '9876543231')
+    # Expected SMS-SUBMIT PDUs, keyed on (number, message, ref); shared by the PDU-mode sending tests
+    _submitPdus = {}
+
+    def submitPdu(self, number, message, ref):
+        """ Returns the (TPDU length, hex string) of the SMS-SUBMIT PDU that sendSms() should write """
+        key = (number, message, ref)
+        if key not in self._submitPdus:
+            calcPdu = gsmmodem.pdu.encodeSmsSubmitPdu(number, message, ref)[0]
+            pduHex = codecs.encode(compat.str(calcPdu.data), 'hex_codec').upper()
+            if PYTHON_VERSION >= 3:
+                pduHex = str(pduHex, 'ascii')
+            self._submitPdus[key] = (calcPdu.tpduLength, pduHex)
+        return self._submitPdus[key]
     
     def initModem(self, smsReceivedCallbackFunc):
         # Override the pyserial import        
@@ -1302,13 +1418,17 @@ class TestSms(unittest.TestCase):
         self.initModem(None)
         self.modem.smsTextMode = True # Set modem to text mode
         self.assertTrue(self.modem.smsTextMode)
-        for number, message, index, smsTime, smsc, pdu, tpdu_length, ref, mem in self.tests:
+        for number, message, index, smsTime, smsc, pdu, tpdu_length, ref, mem in SMS_TESTS:
             self.modem._smsRef = ref
+            expectedCmgs = 'AT+CMGS="{0}"\r'.format(number)
+            expectedText = '{0}{1}'.format(message, chr(26))
             def writeCallbackFunc(data):
                 def writeCallbackFunc2(data):
-                    self.assertEqual('{0}{1}'.format(message, chr(26)), data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('{0}{1}'.format(message, chr(26)), data))
+                    if data != expectedText:
+                        self.fail('Invalid data written to modem; expected "{0}", got: "{1}"'.format(expectedText, data))
                     self.modem.serial.flushResponseSequence = True                
-                self.assertEqual('AT+CMGS="{0}"\r'.format(number), data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CMGS="{0}"'.format(number), data))
+                if data != expectedCmgs:
+                    self.fail('Invalid data written to modem; expected "{0}", got: "{1}"'.format(expectedCmgs[:-1], data))
                 self.modem.serial.writeCallbackFunc = writeCallbackFunc2
             self.modem.serial.writeCallbackFunc = writeCallbackFunc
             self.modem.serial.flushResponseSequence = False
@@ -1327,18 +1447,19 @@ class TestSms(unittest.TestCase):
         self.initModem(None)
         self.modem.smsTextMode = False # Set modem to PDU mode
         self.assertFalse(self.modem.smsTextMode)
-        for number, message, index, smsTime, smsc, pdu, sms_deliver_tpdu_length, ref, mem in self.tests:
+        for number, message, index, smsTime, smsc, pdu, sms_deliver_tpdu_length, ref, mem in SMS_TESTS:
             self.modem._smsRef = ref
-            calcPdu = gsmmodem.pdu.encodeSmsSubmitPdu(number, message, ref)[0]
-            pduHex = codecs.encode(compat.str(calcPdu.data), 'hex_codec').upper()
-            if PYTHON_VERSION >= 3:
-                pduHex = str(pduHex, 'ascii')
+            tpduLength, pduHex = self.submitPdu(number, message, ref)
             
+            expectedCmgs = 'AT+CMGS={0}\r'.format(tpduLength)
+            expectedPdu = '{0}{1}'.format(pduHex, chr(26))
             def writeCallbackFunc(data):
                 def writeCallbackFunc2(data):
-                    self.assertEqual('{0}{1}'.format(pduHex, chr(26)), data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('{0}{1}'.format(pduHex, chr(26)), data))
+                    if data != expectedPdu:
+                        self.fail('Invalid data written to modem; expected "{0}", got: "{1}"'.format(expectedPdu, data))
                     self.modem.serial.flushResponseSequence = True                
-                self.assertEqual('AT+CMGS={0}\r'.format(calcPdu.tpduLength), data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CMGS={0}'.format(calcPdu.tpduLength), data))
+                if data != expectedCmgs:
+                    self.fail('Invalid data written to modem; expected "{0}", got: "{1}"'.format(expectedCmgs[:-1], data))
                 self.modem.serial.writeCallbackFunc = writeCallbackFunc2
             self.modem.serial.writeCallbackFunc = writeCallbackFunc
             self.modem.serial.flushResponseSequence = False
@@ -1359,19 +1480,21 @@ class TestSms(unittest.TestCase):
         """
         self.initModem(None)
         self.modem.smsTextMode = False # Set modem to PDU mode        
-        for number, message, index, smsTime, smsc, pdu, sms_deliver_tpdu_length, ref, mem in self.tests:
+        for number, message, index, smsTime, smsc, pdu, sms_deliver_tpdu_length, ref, mem in SMS_TESTS:
             self.modem._smsRef = ref
-            calcPdu = gsmmodem.pdu.encodeSmsSubmitPdu(number, message, ref)[0]
-            pduHex = codecs.encode(compat.str(calcPdu.data), 'hex_codec').upper()
-            if PYTHON_VERSION >= 3:
-                pduHex = str(pduHex, 'ascii')
+            tpduLength, pduHex = self.submitPdu(number, message, ref)
             
+            expectedCmgs = 'AT+CMGS={0}\r'.format(tpduLength)
+            expectedPdu = '{0}{1}'.format(pduHex, chr(26))
+            # Note thee +ZDONR and +ZPASR unsolicted messages in the "response"
+            cmgsResponse = ['+ZDONR: "METEOR",272,3,"CS_ONLY","ROAM_OFF"\r\n', '+ZPASR: "UMTS"\r\n', '+ZDONR: "METEOR",272,3,"CS_PS","ROAM_OFF"\r\n', '+ZPASR: "UMTS"\r\n', '+CMGS: {0}\r\n'.format(ref), 'OK\r\n']
             def writeCallbackFunc(data):
                 def writeCallbackFunc2(data):
-                    self.assertEqual('{0}{1}'.format(pduHex, chr(26)), data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('{0}{1}'.format(pduHex, chr(26)), data))
-                    # Note thee +ZDONR and +ZPASR unsolicted messages in the "response"
-                    self.modem.serial.responseSequence =  ['+ZDONR: "METEOR",272,3,"CS_ONLY","ROAM_OFF"\r\n', '+ZPASR: "UMTS"\r\n', '+ZDONR: "METEOR",272,3,"CS_PS","ROAM_OFF"\r\n', '+ZPASR: "UMTS"\r\n', '+CMGS: {0}\r\n'.format(ref), 'OK\r\n']
-                self.assertEqual('AT+CMGS={0}\r'.format(calcPdu.tpduLength), data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CMGS={0}'.format(calcPdu.tpduLength), data))
+                    if data != expectedPdu:
+                        self.fail('Invalid data written to modem; expected "{0}", got: "{1}"'.format(expectedPdu, data))
+                    self.modem.serial.responseSequence = cmgsResponse
+                if data != expectedCmgs:
+                    self.fail('Invalid data written to modem; expected "{0}", got: "{1}"'.format(expectedCmgs[:-1], data))
                 self.modem.serial.writeCallbackFunc = writeCallbackFunc2
             self.modem.serial.writeCallbackFunc = writeCallbackFunc
             self.modem.serial.flushResponseSequence = True
@@ -1389,7 +1512,7 @@ class TestSms(unittest.TestCase):
     
     def test_receiveSmsTextMode(self):
         """ Tests receiving SMS messages in text mode """
-        callbackInfo = [False, '', '', -1, None, '', None]
+        callbackInfo = [threading.Event(), '', '', -1, None, '', None]
         def smsReceivedCallbackFuncText(sms):
             try:
                 self.assertIsInstance(sms, gsmmodem.modem.ReceivedSms)
@@ -1400,14 +1523,14 @@ class TestSms(unittest.TestCase):
                 self.assertEqual(sms.status, gsmmodem.modem.Sms.STATUS_RECEIVED_UNREAD)
                 self.assertEqual(sms.smsc, None, 'Text-mode SMS should not have any SMSC information')
             finally:
-                callbackInfo[0] = True
+                callbackInfo[0].set()
 
         self.initModem(smsReceivedCallbackFunc=smsReceivedCallbackFuncText)
         self.modem.smsTextMode = True # Set modem to text mode
         self.assertTrue(self.modem.smsTextMode)
-        for number, message, index, smsTime, smsc, pdu, tpdu_length, ref, mem in self.tests:            
+        for number, message, index, smsTime, smsc, pdu, tpdu_length, ref, mem in SMS_TESTS:            
             # Wait for the handler function to finish
-            callbackInfo[0] = False # "done" flag
+            callbackInfo[0].clear() # "done" flag
             callbackInfo[1] = number
             callbackInfo[2] = message
             callbackInfo[3] = index
@@ -1420,31 +1543,18 @@ class TestSms(unittest.TestCase):
             if tzDelta.days < 0: # negative
                 tzValStr = '-{0:0>2}'.format(int((tzDelta.days * -3600 * 24 - tzDelta.seconds) / 60 / 15))
             textModeStr = smsTime.strftime('%y/%m/%d,%H:%M:%S') + tzValStr
-            def writeCallbackFunc(data):
-                """ Intercept the "read stored message" command """        
-                def writeCallbackFunc2(data):                    
-                    self.assertEqual('AT+CMGR={0}\r'.format(index), data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CMGR={0}'.format(index), data))
-                    self.modem.serial.responseSequence = ['+CMGR: "REC UNREAD","{0}",,"{1}"\r\n'.format(number, textModeStr), '{0}\r\n'.format(message), 'OK\r\n']
-                    def writeCallbackFunc3(data):
-                        self.assertEqual('AT+CMGD={0},0\r'.format(index), data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CMGD={0}'.format(index), data))
-                    self.modem.serial.writeCallbackFunc = writeCallbackFunc3
-                if self.modem._smsMemReadDelete != mem:
-                    self.assertEqual('AT+CPMS="{0}"\r'.format(mem), data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CPMS="{0}"'.format(mem), data))
-                    self.modem.serial.writeCallbackFunc = writeCallbackFunc2
-                else:
-                    # Modem does not need to change read memory
-                    writeCallbackFunc2(data)
-            self.modem.serial.writeCallbackFunc = writeCallbackFunc
+            # The modem's response to the "read stored message" command
+            cmgrResponse = ['+CMGR: "REC UNREAD","{0}",,"{1}"\r\n'.format(number, textModeStr), '{0}\r\n'.format(message), 'OK\r\n']
+            self.modem.serial.writeCallbackFunc = ReadStoredSmsWriteCallback(self, self.modem, mem, index, cmgrResponse)
             # Fake a "new message" notification
             self.modem.serial.responseSequence = ['+CMTI: "{0}",{1}\r\n'.format(mem, index)]
             # Wait for the handler function to finish
-            while callbackInfo[0] == False:
-                time.sleep(0.1)
+            self.assertTrue(callbackInfo[0].wait(5), 'SMS received callback not called')
         self.modem.close()
         
     def test_receiveSmsPduMode(self):
         """ Tests receiving SMS messages in PDU mode """
-        callbackInfo = [False, '', '', -1, None, '', None]
+        callbackInfo = [threading.Event(), '', '', -1, None, '', None]
         def smsReceivedCallbackFuncPdu(sms):
             try:
                 self.assertIsInstance(sms, gsmmodem.modem.ReceivedSms)
@@ -1455,43 +1565,30 @@ class TestSms(unittest.TestCase):
                 self.assertEqual(sms.status, gsmmodem.modem.Sms.STATUS_RECEIVED_UNREAD)
                 self.assertEqual(sms.smsc, callbackInfo[5], 'PDU-mode SMS SMSC number incorrect. Expected: "{0}", got: "{1}"'.format(callbackInfo[5], sms.smsc))
             finally:
-                callbackInfo[0] = True
+                callbackInfo[0].set()
 
         self.initModem(smsReceivedCallbackFunc=smsReceivedCallbackFuncPdu)
         self.modem.smsTextMode = False # Set modem to PDU mode
         self.assertFalse(self.modem.smsTextMode)
-        for pduAddressText in self.testsPduAddressText:
-            for number, message, index, smsTime, smsc, pdu, tpdu_length, ref, mem in self.tests:
+        for pduAddressText in SMS_PDU_ADDRESS_TEXTS:
+            for number, message, index, smsTime, smsc, pdu, tpdu_length, ref, mem in SMS_TESTS:
                 if smsc == None or pdu == None:
                     continue # not enough info for a PDU test, skip it
                 # Wait for the handler function to finish
-                callbackInfo[0] = False # "done" flag
+                callbackInfo[0].clear() # "done" flag
                 callbackInfo[1] = number
                 callbackInfo[2] = message
                 callbackInfo[3] = index
                 callbackInfo[4] = smsTime
                 callbackInfo[5] = smsc
             
-                def writeCallbackFunc(data):
-                    def writeCallbackFunc2(data):
-                        """ Intercept the "read stored message" command """
-                        self.assertEqual('AT+CMGR={0}\r'.format(index), data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CMGR={0}'.format(index), data))
-                        self.modem.serial.responseSequence = ['+CMGR: 0,{0},{1}\r\n'.format(pduAddressText, tpdu_length), '{0}\r\n'.format(pdu), 'OK\r\n']                
-                        def writeCallbackFunc3(data):
-                            self.assertEqual('AT+CMGD={0},0\r'.format(index), data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CMGD={0}'.format(index), data))
-                        self.modem.serial.writeCallbackFunc = writeCallbackFunc3
-                    if self.modem._smsMemReadDelete != mem:
-                        self.assertEqual('AT+CPMS="{0}"\r'.format(mem), data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CPMS="{0}"'.format(mem), data))
-                        self.modem.serial.writeCallbackFunc = writeCallbackFunc2
-                    else:
-                        # Modem does not need to change read memory
-                        writeCallbackFunc2(data)
-                self.modem.serial.writeCallbackFunc = writeCallbackFunc
+                # The modem's response to the "read stored message" command
+                cmgrResponse = ['+CMGR: 0,{0},{1}\r\n'.format(pduAddressText, tpdu_length), '{0}\r\n'.format(pdu), 'OK\r\n']
+                self.modem.serial.writeCallbackFunc = ReadStoredSmsWriteCallback(self, self.modem, mem, index, cmgrResponse)
                 # Fake a "new message" notification
                 self.modem.serial.responseSequence = ['+CMTI: "SM",{0}\r\n'.format(index)]
                 # Wait for the handler function to finish
-                while callbackInfo[0] == False:
-                    time.sleep(0.1)
+                self.assertTrue(callbackInfo[0].wait(5), 'SMS received callback not called')
         self.modem.close()
 
     def test_sendSms_refCount(self):
@@ -1606,7 +1703,7 @@ class TestStoredSms(unittest.TestCase):
     
     def initFakeModemResponses(self, textMode):
         global FAKE_MODEM
-        FAKE_MODEM = copy(fakemodems.GenericTestModem())
+        FAKE_MODEM = fakemodems.GenericTestModem()
         modem = gsmmodem.modem.GsmModem('--weak ref object--')
         self.expectedMessages = [ReceivedSms(modem, Sms.STATUS_RECEIVED_UNREAD, '+27748577604', datetime(2013, 1, 28, 14, 51, 42, tzinfo=SimpleOffsetTzInfo(2)), 'Hello raspberry pi', None),
                                  ReceivedSms(modem, Sms.STATUS_RECEIVED_READ, '+2784000153099999', datetime(2013, 2, 7, 1, 31, 44, tzinfo=SimpleOffsetTzInfo(2)), 'New and here to stay! Don\'t just recharge SUPACHARGE and get your recharged airtime+FREE CellC to CellC mins & SMSs+Free data to use anytime. T&C apply. Cell C', None),
@@ -1930,20 +2027,9 @@ class TestSmsStatusReports(unittest.TestCase):
                     callbackDone[0] = True
             self.initModem(smsStatusReportCallback=smsStatusReportCallbackFuncText)
             self.modem.smsTextMode = True
-            def writeCallbackFunc(data):
-                def writeCallbackFunc2(data):                    
-                    self.assertEqual('AT+CMGR={0}\r'.format(index), data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CMGR={0}'.format(index), data))
-                    self.modem.serial.responseSequence = ['{0}\r\n'.format(notification), 'OK\r\n']
-                    def writeCallbackFunc3(data):
-                        self.assertEqual('AT+CMGD={0},0\r'.format(index), data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CMGD={0}'.format(index), data))
-                    self.modem.serial.writeCallbackFunc = writeCallbackFunc3
-                if self.modem._smsMemReadDelete != mem:
-                    self.assertEqual('AT+CPMS="{0}"\r'.format(mem), data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CPMS="{0}"'.format(mem), data))
-                    self.modem.serial.writeCallbackFunc = writeCallbackFunc2
-                else:
-                    # Modem does not need to change read memory
-                    writeCallbackFunc2(data)
-            self.modem.serial.writeCallbackFunc = writeCallbackFunc
+            # The modem's response to the "read stored message" command
+            cmgrResponse = ['{0}\r\n'.format(notification), 'OK\r\n']
+            self.modem.serial.writeCallbackFunc = ReadStoredSmsWriteCallback(self, self.modem, mem, index, cmgrResponse)
             # Fake a "new status report" notification
             self.modem.serial.responseSequence = ['+CDSI: "{0}",{1}\r\n'.format(mem, index)]
             # Wait for the handler function to finish
@@ -2018,20 +2104,7 @@ class TestSmsStatusReports(unittest.TestCase):
                     callbackDone[0] = True
             self.initModem(smsStatusReportCallback=smsStatusReportCallbackFuncText)
             self.modem.smsTextMode = False
-            def writeCallbackFunc(data):
-                def writeCallbackFunc2(data):                    
-                    self.assertEqual('AT+CMGR={0}\r'.format(index), data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CMGR={0}'.format(index), data))
-                    self.modem.serial.responseSequence = responseSeq
-                    def writeCallbackFunc3(data):
-                        self.assertEqual('AT+CMGD={0},0\r'.format(index), data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CMGD={0}'.format(index), data))
-                    self.modem.serial.writeCallbackFunc = writeCallbackFunc3
-                if self.modem._smsMemReadDelete != mem:
-                    self.assertEqual('AT+CPMS="{0}"\r'.format(mem), data, 'Invalid data written to modem; expected "{0}", got: "{1}"'.format('AT+CPMS="{0}"'.format(mem), data))
-                    self.modem.serial.writeCallbackFunc = writeCallbackFunc2
-                else:
-                    # Modem does not need to change read memory
-                    writeCallbackFunc2(data)
-            self.modem.serial.writeCallbackFunc = writeCallbackFunc
+            self.modem.serial.writeCallbackFunc = ReadStoredSmsWriteCallback(self, self.modem, mem, index, responseSeq)
             # Fake a "new status report" notification
             self.modem.serial.responseSequence = ['+CDSI: "{0}",{1}\r\n'.format(mem, index)]
             # Wait for the handler function to finish
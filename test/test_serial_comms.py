@@ -45,7 +45,7 @@ class MockSerialPackage(object):
 #                time.sleep(min(timeout, self._REPONSE_TIME))                
 #                if timeout > self._REPONSE_TIME and len(self.writeQueue) == 0:
 #                    time.sleep(timeout - self._REPONSE_TIME)
-                return ''
+                return b''
             else:
                 while self._alive:
                     if len(self.writeQueue) > 0:
@@ -59,12 +59,14 @@ class MockSerialPackage(object):
             if len(self._readQueue) == 0:
                 if len(self.responseSequence) > 0:
                     value = self.responseSequence.pop(0)    
-                    if type(value) in (float, int):
+                    if isinstance(value, (int, float)):
                         time.sleep(value)                        
                         if len(self.responseSequence) > 0:                            
                             self._setupReadValue(command)                    
-                    else:                        
-                        self._readQueue = list(value)
+                    else:
+                        # Real serial ports return bytes
+                        value = value.encode('latin-1')
+                        self._readQueue = [value[i:i+1] for i in range(len(value))]
 
         def write(self, data):            
             if self.writeCallbackFunc != None:
@@ -77,7 +79,7 @@ class MockSerialPackage(object):
         def inWaiting(self):
             rqLen = len(self._readQueue)
             for item in self.responseSequence:
-                if type(item) in (int, float):
+                if isinstance(item, (int, float)):
                     break
                 else:
                     rqLen += len(item)
@@ -129,6 +131,24 @@ class TestNotifications(unittest.TestCase):
                 time.sleep(0.05)            
             serialComms.close()
 
+    def test_multipleLinesPerRead(self):
+        """ Tests that several lines returned by a single read are grouped into one notification """
+        notifications = []
+        serialComms = gsmmodem.serial_comms.SerialComms('-- PORT IGNORED DURING TESTS --', notifyCallbackFunc=notifications.append)
+        serialComms.connect()
+        chunks = [b'RING\r\n\r\n+CLIP: "+27820001234",145\r', b'\n']
+        def chunkedRead(*args, **kwargs):
+            if len(chunks) > 0:
+                return chunks.pop(0)
+            time.sleep(0.001)
+            return b''
+        serialComms.serial.read = chunkedRead
+        while len(chunks) > 0:
+            time.sleep(0.05)
+        time.sleep(0.05)
+        serialComms.close()
+        self.assertEqual(notifications, [['RING', '+CLIP: "+27820001234",145']])
+
 class TestSerialException(unittest.TestCase):
     """ Tests SerialException handling """
     
@@ -183,6 +203,8 @@ class TestWrite(unittest.TestCase):
         tests = ((['OK\r\n'], ['OK']),
                  (['ERROR\r\n'], ['ERROR']),
                  (['first line\r\n', 'second line\r\n', 'OK\r\n'], ['first line', 'second line', 'OK']),
+                 (['+CME ERROR: 10\r\n'], ['+CME ERROR: 10']),
+                 (['+CMS ERROR: 330\r\n'], ['+CMS ERROR: 330']),
                  # Some Huawei modems issue this response instead of ERROR for unknown commands; ensure we detect it correctly
                  (['COMMAND NOT SUPPORT\r\n'], ['COMMAND NOT SUPPORT']))
         for actual, expected in tests:
@@ -194,6 +216,20 @@ class TestWrite(unittest.TestCase):
             response = self.serialComms.write('test2\r', waitForResponse=False)
             self.assertEqual(response, None) 
     
+    def test_writeExpectedResponseTermSeq(self):
+        """ Tests detecting a custom response terminator that arrives in the same read as other data """
+        chunks = [b'\r\n> ']
+        def chunkedRead(*args, **kwargs):
+            if len(chunks) > 0:
+                return chunks.pop(0)
+            time.sleep(0.001)
+            return b''
+        def writeCallback(data):
+            self.serialComms.serial.read = chunkedRead
+        self.serialComms.serial.writeCallbackFunc = writeCallback
+        response = self.serialComms.write('AT+CMGS=12\r', timeout=1, expectedResponseTermSeq='> ')
+        self.assertEqual(response, ['> '])
+
     def test_writeTimeout(self):
         """ Tests that the serial comms write timeout parameter """
         # Serial comms will not response (no response sequence specified)
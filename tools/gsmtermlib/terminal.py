@@ -402,7 +402,7 @@ class GsmTerm(RawTerm):
             elif inputStrLower.startswith('ls'):                
                 if inputStrLower == 'lscat':
                     sys.stdout.write('\n')         
-                    for category in self.completion.categories:
+                    for category in self.completionCategories:
                         sys.stdout.write('{0}\n'.format(category))
                     self._refreshInputPrompt(len(self.inputBuffer))
                     return
@@ -416,7 +416,7 @@ class GsmTerm(RawTerm):
                     ls = inputStrLower.split(' ', 1)                    
                     if len(ls) == 2:
                         category = ls[1].lower()
-                        if category in [cat.lower() for cat in self.completion.categories]:
+                        if category in [cat.lower() for cat in self.completionCategories]:
                             sys.stdout.write('\n')
                             for command in self.completion:
                                 commandHelp = self.completion[command]
@@ -599,10 +599,6 @@ class GsmTerm(RawTerm):
     def _initAtCommandsTrie(self):
         self.completion = Trie()
         from .atcommands import ATCOMMANDS, CATEGORIES
-        for command, help in ATCOMMANDS:
-            if help != None:
-                self.completion[command] = help
-            else:
-                self.completion[command] = None
-        self.completion.categories = CATEGORIES
+        self.completion.update(ATCOMMANDS)
+        self.completionCategories = CATEGORIES
 
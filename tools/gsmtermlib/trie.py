@@ -13,6 +13,9 @@ else: #pragma: no cover
 
 
 class Trie(object):
+
+    # Every node is a Trie instance; slots keep each node down to its three fields
+    __slots__ = ('slots', 'key', 'value')
         
     def __init__(self, key=None, value=None):
         self.slots = {}        
@@ -22,35 +25,42 @@ class Trie(object):
     def __setitem__(self, key, value):
         if key == None:            
             raise ValueError('Key may not be None')
-    
-        if len(key) == 0:
-            # All of the original key's chars have been nibbled away            
-            self.value = value
-            self.key = ''
-            return        
-        
-        c = key[0]
-        
-        if c not in self.slots:
-            # Unused slot - no collision
-            if self.key != None and len(self.key) > 0:
+        # Walk down the trie iteratively (no recursive call or key slice per character)
+        trie = self
+        i = 0
+        keyLen = len(key)
+        while i < keyLen:
+            slots = trie.slots
+            c = key[i]
+            if c in slots:
+                trie = slots[c]
+                i += 1
+            elif trie.key != None and len(trie.key) > 0:
                 # This was a "leaf" previously - create a new branch for its current value
-                branchC = self.key[0]
-                branchKey = self.key[1:] if len(self.key) > 1 else ''                            
-                self.slots[branchC] = Trie(branchKey, self.value)
-                self.key = None
-                self.value = None
+                branchC = trie.key[0]
+                slots[branchC] = Trie(trie.key[1:], trie.value)
+                trie.key = None
+                trie.value = None
                 if branchC != c:
-                    self.slots[c] = Trie(key[1:], value)
-                else:
-                    self.slots[c][key[1:]] = value
+                    slots[c] = Trie(key[i + 1:], value)
+                    return
+                # Collision with the old leaf's branch - continue down it
             else:
-                # Store specified value in a new branch and return                
-                self.slots[c] = Trie(key[1:], value)
-        else:
-            trie = self.slots[c]
-            trie[key[1:]] = value             
+                # Unused slot - store specified value in a new branch and return
+                slots[c] = Trie(key[i + 1:], value)
+                return
+        # All of the original key's chars have been nibbled away
+        trie.value = value
+        trie.key = ''
 
+    def update(self, items):
+        """ Stores all the specified key/value pairs (a dict, or an iterable of (key, value) tuples) """
+        global dictItemsIter
+        if isinstance(items, dict):
+            items = dictItemsIter(items)
+        setItem = self.__setitem__
+        for key, value in items:
+            setItem(key, value)
 
     def __delitem__(self, key):
         if key == None:            
@@ -79,18 +89,23 @@ class Trie(object):
     def __getitem__(self, key):
         if key == None:            
             raise ValueError('Key may not be None')
-        if len(key) == 0:
-            if self.key == '':
-                # All of the original key's chars have ben nibbled away
-                return self.value
+        # Walk down the trie iteratively (no recursive call or key slice per character)
+        trie = self
+        i = 0
+        keyLen = len(key)
+        while i < keyLen:
+            slots = trie.slots
+            c = key[i]
+            if c in slots:
+                trie = slots[c]
+                i += 1
+            elif key[i:] == trie.key:
+                return trie.value
             else:
                 raise KeyError(key)
-        c = key[0]        
-        if c in self.slots:
-            trie = self.slots[c]
-            return trie[key[1:]]
-        elif key == self.key:
-            return self.value
+        if trie.key == '':
+            # All of the original key's chars have been nibbled away
+            return trie.value
         else:
             raise KeyError(key)
 
@@ -154,30 +169,35 @@ class Trie(object):
         """ Return the longest common prefix shared by all keys that start with prefix
         (note: the return value will always start with the specified prefix)
         """
-        return self._longestCommonPrefix(prefix, '')
-
-    def _longestCommonPrefix(self, key, prefix):
-        if len(key) == 0:
-            if self.key != None:
-                return prefix + self.key
-            else:
-                slotKeys = list(self.slots.keys())
-                if len(slotKeys) == 1:
-                    c = slotKeys[0]
-                    return self.slots[c]._longestCommonPrefix('', prefix + c)
+        # Single downward walk; the characters of the matched path are collected and joined at the end
+        trie = self
+        path = []
+        i = 0
+        prefixLen = len(prefix)
+        while True:
+            if i == prefixLen:
+                if trie.key != None:
+                    return ''.join(path) + trie.key
+                elif len(trie.slots) == 1:
+                    # Only one way down - extend the common prefix
+                    c = list(trie.slots.keys())[0]
+                    trie = trie.slots[c]
+                    path.append(c)
                 else:
-                    return prefix
-        elif self.key != None:
-            if self.key.startswith(key):
-                return prefix + self.key
-            else:
-                return '' # nothing starts with the specified prefix
-        else:
-            c = key[0]
-            if c in self.slots:
-                return self.slots[c]._longestCommonPrefix(key[1:], prefix + c)
+                    return ''.join(path)
+            elif trie.key != None:
+                if trie.key.startswith(prefix[i:]):
+                    return ''.join(path) + trie.key
+                else:
+                    return '' # nothing starts with the specified prefix
             else:
-                return '' # nothing starts with the specified prefix
+                c = prefix[i]
+                if c in trie.slots:
+                    trie = trie.slots[c]
+                    path.append(c)
+                    i += 1
+                else:
+                    return '' # nothing starts with the specified prefix
     
     def __iter__(self):
         for k in list(self.keys()):